@@ -2,28 +2,139 @@
 CalDAV client for creating birthday events
 """
 
+import functools
+import hashlib
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, Optional
-import vobject
+import re
+import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional, Tuple
 import caldav
+from icalendar import Alarm, Calendar
+from requests.adapters import HTTPAdapter
 from config import get_birthday_config
 
 logger = logging.getLogger(__name__)
 
+# All-day events always span exactly one day; build the delta once
+_ONE_DAY = timedelta(days=1)
+
+# Every birthday event has the same shape; render the iCalendar text
+# directly instead of assembling and serializing a parser tree per event
+_ICAL_EVENT_TEMPLATE = (
+    "BEGIN:VCALENDAR\r\n"
+    "VERSION:2.0\r\n"
+    "PRODID:-//bdaysync//birthday-sync//EN\r\n"
+    "BEGIN:VEVENT\r\n"
+    "UID:{uid}\r\n"
+    "DTSTART;VALUE=DATE:{dtstart}\r\n"
+    "DTEND;VALUE=DATE:{dtend}\r\n"
+    "SUMMARY:{summary}\r\n"
+    "DESCRIPTION:{description}\r\n"
+    "CATEGORIES:{category}\r\n"
+    "RRULE:FREQ=YEARLY\r\n"
+    "X-BDAYSYNC-HASH:{content_hash}\r\n"
+    "{alarms}"
+    "END:VEVENT\r\n"
+    "END:VCALENDAR\r\n"
+)
+
+_ICAL_ALARM_TEMPLATE = (
+    "BEGIN:VALARM\r\n"
+    "ACTION:DISPLAY\r\n"
+    "TRIGGER:{trigger}\r\n"
+    "DESCRIPTION:{description}\r\n"
+    "END:VALARM\r\n"
+)
+
+# Our deterministic UIDs (and the summary, for legacy events) can be
+# pulled out with a line match, no need to build a full iCalendar tree
+# just to read one property
+_UID_RE = re.compile(rb'^UID:(birthday-[^\r\n]+)', re.M)
+_SUMMARY_RE = re.compile(rb'^SUMMARY:([^\r\n]+)', re.M)
+
+# Characters dropped from UID slugs: anything outside [a-z0-9-] would
+# pick up TEXT escaping when icalendar re-serializes an updated event,
+# and the escaped UID would no longer match the raw index keys
+_SLUG_UNSAFE_RE = re.compile(r'[^a-z0-9-]+')
+
+def _slugify(name: str) -> str:
+    """Build the deterministic, escape-proof UID slug for a contact name"""
+    return _SLUG_UNSAFE_RE.sub('', name.lower().replace(' ', '-'))
+
+def _ical_escape(value: str) -> str:
+    """Escape a TEXT property value per RFC 5545"""
+    return (value.replace('\\', '\\\\')
+                 .replace(';', '\\;')
+                 .replace(',', '\\,')
+                 .replace('\n', '\\n'))
+
+def _ical_trigger(days_before: int) -> str:
+    """Render a negative day-offset alarm trigger"""
+    return 'PT0S' if days_before == 0 else f"-P{days_before}D"
+
+def _fold_ical(text: str) -> bytes:
+    """Serialize rendered iCalendar text to wire bytes, folding long lines
+
+    RFC 5545 caps content lines at 75 octets. The template literals are
+    all short, so only substituted values (long names or descriptions)
+    ever need the fold and the common case is a single encode.
+    """
+    data = text.encode('utf-8')
+    lines = data.split(b'\r\n')
+    if all(len(line) <= 75 for line in lines):
+        return data
+
+    folded = []
+    for line in lines:
+        while len(line) > 75:
+            cut = 75
+            # Never split a multi-byte UTF-8 sequence mid-character
+            while cut > 1 and (line[cut] & 0xC0) == 0x80:
+                cut -= 1
+            folded.append(line[:cut])
+            line = b' ' + line[cut:]
+        folded.append(line)
+    return b'\r\n'.join(folded)
+
+@functools.lru_cache(maxsize=4)
+def _discover(server_url: str, username: str, password: str):
+    """Connect and discover the principal's calendars, cached per credentials
+
+    Discovery costs two synchronous round trips (principal lookup plus
+    calendar-home PROPFIND); in the long-running daemon these are the
+    same answer on every scheduled tick, so cache them for the process
+    lifetime. Failures are not cached, so a bad connection retries.
+    """
+    client = caldav.DAVClient(
+        url=server_url,
+        username=username,
+        password=password
+    )
+    # Reuse one pooled connection for all PUTs so every request
+    # after the first skips the TLS + auth handshake. requests'
+    # digest handler caches the server nonce on the auth object,
+    # so keeping the session alive also keeps auth pre-emptive.
+    session = getattr(client, 'session', None)
+    if session is not None:
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=8, pool_block=False)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+    principal = client.principal()
+    calendars = tuple(principal.calendars())
+    return client, principal, calendars
+
 class CalDAVClient:
     """Client for creating events in CalDAV server"""
-    
+
     def __init__(self, server_url: str, username: str, password: str):
         try:
-            self.client = caldav.DAVClient(
-                url=server_url,
-                username=username,
-                password=password
-            )
-            self.principal = self.client.principal()
-            self.calendars = self.principal.calendars()
-            
+            self.client, self.principal, calendars = _discover(server_url, username, password)
+            self.calendars = list(calendars)
+
             if not self.calendars:
                 raise Exception("No calendars found")
                 
@@ -33,7 +144,16 @@ class CalDAVClient:
             
             # Load configuration from environment variables
             self._load_config()
-            
+
+            # In-memory index of existing birthday events, filled by
+            # preload_existing_events() to avoid one REPORT per contact
+            self._event_index: Dict[Tuple[str, date], object] = {}
+            self._uid_index: Dict[str, object] = {}
+            self._preloaded_years = set()
+            # Guards index writes when events are created concurrently;
+            # lookups stay lock-free
+            self._index_lock = threading.Lock()
+
         except Exception as e:
             logger.error(f"Error connecting to CalDAV server: {e}")
             raise
@@ -55,90 +175,262 @@ class CalDAVClient:
         self.reminder_template = config['reminder_template']
         self.event_category = config['event_category']
         self.update_existing = config['update_existing']
-        
-        logger.info("Birthday event configuration:")
-        logger.info(f"  Title template: {self.event_title_template}")
-        logger.info(f"  Description template: {self.event_description_template}")
-        logger.info(f"  Reminder days: {self.reminder_days}")
-        logger.info(f"  Reminder message: {self.reminder_template}")
-        logger.info(f"  Category: {self.event_category}")
-        logger.info(f"  Update existing: {self.update_existing}")
-    
+
+        # Pre-parse the format strings once so rendering an event (and
+        # each of its alarms) is a plain string join instead of a full
+        # str.format re-tokenization per call
+        self._render_title = self._compile_template(self.event_title_template)
+        self._render_description = self._compile_template(self.event_description_template)
+        self._render_reminder = self._compile_template(self.reminder_template)
+
+        # reminder_days is a small fixed list, so the template work and
+        # pluralization fixups can happen once here instead of per alarm
+        self._reminder_renderers = self._build_reminder_renderers()
+
+        # Configuration echo is debug-only: _load_config runs on every
+        # client instantiation and the values never change mid-process
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Birthday event configuration:")
+            logger.debug("  Title template: %s", self.event_title_template)
+            logger.debug("  Description template: %s", self.event_description_template)
+            logger.debug("  Reminder days: %s", self.reminder_days)
+            logger.debug("  Reminder message: %s", self.reminder_template)
+            logger.debug("  Category: %s", self.event_category)
+            logger.debug("  Update existing: %s", self.update_existing)
+
+    @staticmethod
+    def _compile_template(template: str):
+        """Pre-tokenize a str.format template into a fast renderer"""
+        parsed = list(string.Formatter().parse(template))
+
+        def render(**values):
+            parts = []
+            for literal, field, spec, _ in parsed:
+                parts.append(literal)
+                if field is not None:
+                    parts.append(format(values[field], spec or ''))
+            return ''.join(parts)
+
+        return render
+
+    def flush(self):
+        """Close the pooled HTTP session once the sync loop is done"""
+        try:
+            session = getattr(self.client, 'session', None)
+            if session is not None:
+                session.close()
+        except Exception as e:
+            logger.debug(f"Error closing CalDAV session: {e}")
+
+    def preload_existing_events(self, year: int = None):
+        """Prefetch all existing birthday events for a year into an in-memory index
+
+        Issues a single wide-range calendar-query REPORT instead of one
+        narrow REPORT per contact, so _find_existing_event becomes a pure
+        dict lookup for the preloaded year.
+        """
+        try:
+            if year is None:
+                year = datetime.now().year
+
+            search_xml = f'''
+            <c:calendar-query xmlns:d="DAV:" xmlns:c="urn:ietf:params:xml:ns:caldav">
+                <d:prop>
+                    <d:getetag/>
+                    <c:calendar-data/>
+                </d:prop>
+                <c:filter>
+                    <c:comp-filter name="VCALENDAR">
+                        <c:comp-filter name="VEVENT">
+                            <c:time-range start="{year}0101T000000Z"
+                                         end="{year + 1}0101T000000Z"/>
+                        </c:comp-filter>
+                    </c:comp-filter>
+                </c:filter>
+            </c:calendar-query>'''
+
+            events = self.calendar.search(search_xml)
+            indexed = self._index_search_results(events)
+
+            self._preloaded_years.add(year)
+            logger.info(f"Preloaded {indexed} existing birthday events for {year}")
+
+        except Exception as e:
+            logger.warning(f"Could not preload existing events for {year}: {e}")
+
+    def _index_search_results(self, events) -> int:
+        """Index search results by UID without parsing full iCalendar trees
+
+        Extracts the deterministic birthday-<slug>-<yyyymmdd> UID with a
+        single regex per event; the full parse is deferred to the one
+        event that actually needs updating.
+        """
+        indexed = 0
+
+        for event in events:
+            try:
+                data = event.data
+                if isinstance(data, str):
+                    data = data.encode('utf-8')
+
+                match = _UID_RE.search(data)
+                if not match:
+                    continue
+                uid = match.group(1).decode('utf-8').strip()
+
+                # UIDs we generate look like birthday-<slug>-<yyyymmdd>
+                uid_prefix, _, date_part = uid.rpartition('-')
+                with self._index_lock:
+                    self._uid_index[uid_prefix] = event
+
+                    if len(date_part) == 8 and date_part.isdigit():
+                        slug = uid_prefix[len('birthday-'):]
+                        event_date = datetime.strptime(date_part, '%Y%m%d').date()
+                        self._event_index[(slug, event_date)] = event
+
+                indexed += 1
+            except Exception as e:
+                logger.debug(f"Error indexing existing event: {e}")
+                continue
+
+        return indexed
+
+    def create_birthday_events(self, contacts, years=None, max_workers: int = 8) -> int:
+        """Create birthday events for multiple contacts concurrently
+
+        Accepts a single year or an iterable of years; the jobs for every
+        (contact, year) pair share one bounded thread pool, so syncing the
+        current and next year costs one fan-out instead of two sequential
+        ones. Each event has an independent UID and the per-contact work
+        is network-bound. Returns how many events were created or updated.
+        """
+        if not contacts:
+            return 0
+        if years is None:
+            years = (datetime.now().year,)
+        elif isinstance(years, int):
+            years = (years,)
+
+        jobs = [(contact, year) for contact in contacts for year in years]
+        created_count = 0
+        workers = min(max_workers, len(jobs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for created in executor.map(lambda job: self.create_birthday_event(*job), jobs):
+                if created:
+                    created_count += 1
+        return created_count
+
     def create_birthday_event(self, contact: Dict, year: int = None) -> bool:
         """Create a birthday event for a contact"""
+        # Bind the name before the try so the error path reuses the local
+        # instead of a second dict lookup
+        name = contact.get('name', 'unknown')
         try:
             if year is None:
                 year = datetime.now().year
-            
+
             birthday = contact['birthday']
-            name = contact['name']
-            
+
             # Create event date for this year
             event_date = birthday.replace(year=year)
-            
+
+            # Compute the slug and UID once; the existence check and the
+            # event body both reuse them
+            slug = _slugify(name)
+            event_uid = f"birthday-{slug}-{event_date.strftime('%Y%m%d')}"
+
             # Generate event details from templates
-            event_title = self.event_title_template.format(name=name)
-            event_description = self.event_description_template.format(name=name)
-            
+            event_title = self._render_title(name=name)
+            event_description = self._render_description(name=name)
+
+            content_hash = self._content_hash(event_title, event_description, event_date)
+
             # Check if event already exists
-            existing_event = self._find_existing_event(name, event_date)
+            existing_event = self._find_existing_event(name, event_date, slug)
             if existing_event:
                 if self.update_existing:
-                    return self._update_existing_event(existing_event, contact, year, event_title, event_description)
+                    return self._update_existing_event(existing_event, contact, year, event_title, event_description, content_hash)
                 else:
-                    logger.info(f"Birthday event for {name} on {event_date} already exists (skipping update)")
+                    logger.info("Birthday event for %s on %s already exists (skipping update)", name, event_date)
                     return False
             
-            # Create unique UID
-            event_uid = f"birthday-{name.replace(' ', '-').lower()}-{event_date.strftime('%Y%m%d')}"
-            
-            # Create iCalendar event
-            cal = vobject.iCalendar()
-            
-            # Add event
-            event = cal.add('vevent')
-            event.add('uid').value = event_uid
-            event.add('dtstart').value = event_date
-            event.add('dtend').value = event_date + timedelta(days=1)
-            event.add('summary').value = event_title
-            event.add('description').value = event_description
-            event.add('categories').value = [self.event_category]
-            
-            # Make it an all-day event
-            event.dtstart.params['VALUE'] = 'DATE'
-            event.dtend.params['VALUE'] = 'DATE'
-            
-            # Add yearly recurrence
-            event.add('rrule').value = 'FREQ=YEARLY'
-            
-            # Add reminders
-            for days_before in self.reminder_days:
-                alarm = event.add('valarm')
-                alarm.add('action').value = 'DISPLAY'
-                alarm.add('trigger').value = timedelta(days=-days_before)
-                
-                # Generate reminder message
-                reminder_message = self._format_reminder_message(name, days_before)
-                alarm.add('description').value = reminder_message
-            
-            # Save to CalDAV server
-            self.calendar.save_event(cal.serialize())
-            logger.info(f"Created birthday event for {name} on {event_date}")
-            logger.info(f"  Title: {event_title}")
-            logger.info(f"  Reminders: {len(self.reminder_days)} reminder(s) {self.reminder_days} days before")
+            # Render the iCalendar event directly from the text template
+            alarms = ''.join(
+                _ICAL_ALARM_TEMPLATE.format(
+                    trigger=_ical_trigger(days_before),
+                    description=_ical_escape(self._format_reminder_message(name, days_before))
+                )
+                for days_before in self.reminder_days
+            )
+            ical_text = _ICAL_EVENT_TEMPLATE.format(
+                uid=event_uid,
+                dtstart=event_date.strftime('%Y%m%d'),
+                dtend=(event_date + _ONE_DAY).strftime('%Y%m%d'),
+                summary=_ical_escape(event_title),
+                description=_ical_escape(event_description),
+                category=_ical_escape(self.event_category),
+                content_hash=content_hash,
+                alarms=alarms
+            )
+
+            # Save to CalDAV server as pre-folded wire bytes
+            saved_event = self.calendar.save_event(_fold_ical(ical_text))
+
+            # Register the new event immediately so later jobs in the
+            # same run (other years, or contacts sharing a slug) find it
+            # in the index instead of creating a duplicate
+            with self._index_lock:
+                self._uid_index[f"birthday-{slug}"] = saved_event
+                self._event_index[(slug, event_date)] = saved_event
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Created birthday event for %s on %s", name, event_date)
+                logger.info("  Title: %s", event_title)
+                logger.info("  Reminders: %d reminder(s) %s days before", len(self.reminder_days), self.reminder_days)
             return True
             
         except Exception as e:
-            logger.error(f"Error creating birthday event for {contact.get('name', 'unknown')}: {e}")
+            logger.error(f"Error creating birthday event for {name}: {e}")
             return False
     
+    def _content_hash(self, event_title: str, event_description: str, event_date: date) -> str:
+        """Digest of the event content we control, stamped as X-BDAYSYNC-HASH
+
+        Only the month and day of the date participate: the year is the
+        sync year, which rolls forward annually for recurring events,
+        while a corrected birthday changes the month/day and must defeat
+        the hash short-circuit so the update path runs.
+        """
+        payload = (f"{event_title}|{event_description}|"
+                   f"{event_date.strftime('%m%d')}|{sorted(self.reminder_days)}")
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=8).hexdigest()
+
+    def _build_reminder_renderers(self) -> Dict[int, object]:
+        """Pre-render one reminder message closure per configured days-before"""
+        renderers = {}
+        sentinel = '\x00name\x00'
+
+        for days_before in self.reminder_days:
+            message = self._render_reminder_message(sentinel, days_before)
+            # Splitting around the sentinel leaves only a join per call
+            parts = tuple(message.split(sentinel))
+            renderers[days_before] = lambda name, parts=parts: name.join(parts)
+
+        return renderers
+
     def _format_reminder_message(self, name: str, days_before: int) -> str:
         """Format the reminder message based on template"""
+        renderer = self._reminder_renderers.get(days_before)
+        if renderer is not None:
+            return renderer(name)
+        return self._render_reminder_message(name, days_before)
+
+    def _render_reminder_message(self, name: str, days_before: int) -> str:
+        """Render a reminder message from the template (uncached path)"""
         try:
             if days_before == 0:
                 # Special handling for "today"
                 if '{days}' in self.reminder_template:
-                    message = self.reminder_template.format(name=name, days=days_before)
+                    message = self._render_reminder(name=name, days=days_before)
                     # Replace common patterns with "today"
                     message = message.replace('in 0 days', 'today')
                     message = message.replace('in 0 day', 'today')
@@ -147,12 +439,12 @@ class CalDAVClient:
                 else:
                     return f"Today is {name}'s birthday!"
             elif days_before == 1:
-                message = self.reminder_template.format(name=name, days=days_before)
+                message = self._render_reminder(name=name, days=days_before)
                 # Fix pluralization for 1 day
                 message = message.replace('1 days', '1 day')
                 return message
             else:
-                return self.reminder_template.format(name=name, days=days_before)
+                return self._render_reminder(name=name, days=days_before)
         except (KeyError, ValueError, AttributeError) as e:
             logger.warning(f"Error formatting reminder message with template '{self.reminder_template}': {e}, using simple format")
             
@@ -164,10 +456,21 @@ class CalDAVClient:
             else:
                 return f"{name}'s birthday is in {days_before} days!"
     
-    def _find_existing_event(self, name: str, date) -> Optional:
+    def _find_existing_event(self, name: str, date, slug: str = None) -> Optional:
         """Find existing birthday event for a contact"""
+        # Fast path: consult the preloaded index before touching the network
+        if slug is None:
+            slug = _slugify(name)
+        if date.year in self._preloaded_years:
+            event = self._event_index.get((slug, date))
+            if event is None:
+                event = self._uid_index.get(f"birthday-{slug}")
+            return event
+
         try:
-            # Use the new calendar.search method instead of deprecated date_search
+            # Push the selection to the server: filter by our deterministic
+            # UID prefix instead of pulling the whole time window and
+            # re-filtering summaries client-side
             search_xml = f'''
             <c:calendar-query xmlns:d="DAV:" xmlns:c="urn:ietf:params:xml:ns:caldav">
                 <d:prop>
@@ -177,54 +480,48 @@ class CalDAVClient:
                 <c:filter>
                     <c:comp-filter name="VCALENDAR">
                         <c:comp-filter name="VEVENT">
-                            <c:time-range start="{date.strftime('%Y%m%d')}T000000Z" 
-                                         end="{(date + timedelta(days=1)).strftime('%Y%m%d')}T000000Z"/>
+                            <c:time-range start="{date.strftime('%Y%m%d')}T000000Z"
+                                         end="{(date + _ONE_DAY).strftime('%Y%m%d')}T000000Z"/>
+                            <c:prop-filter name="UID">
+                                <c:text-match collation="i;unicode-casemap">birthday-{slug}</c:text-match>
+                            </c:prop-filter>
                         </c:comp-filter>
                     </c:comp-filter>
                 </c:filter>
             </c:calendar-query>'''
-            
+
             events = self.calendar.search(search_xml)
-            
+
+            # The server already matched on our UID prefix, so any hit is ours
             for event in events:
-                try:
-                    cal = vobject.readOne(event.data)
-                    if hasattr(cal.vevent, 'summary'):
-                        summary = cal.vevent.summary.value
-                        # Check if this event is for this person (name appears in summary)
-                        if name in summary and (self.event_category.lower() in summary.lower() or 'birthday' in summary.lower()):
-                            return event
-                        # Also check by UID pattern
-                        if hasattr(cal.vevent, 'uid'):
-                            uid = cal.vevent.uid.value
-                            expected_uid = f"birthday-{name.replace(' ', '-').lower()}"
-                            if uid.startswith(expected_uid):
-                                return event
-                except Exception as e:
-                    logger.debug(f"Error parsing existing event: {e}")
-                    continue
+                return event
             return None
-            
+
         except Exception as e:
             logger.debug(f"Error searching for existing events with new method: {e}")
             
             # Fallback to deprecated method if available
             try:
                 logger.debug("Falling back to deprecated date_search method")
-                events = self.calendar.date_search(date, date + timedelta(days=1))
+                events = self.calendar.date_search(date, date + _ONE_DAY)
                 
                 for event in events:
                     try:
-                        cal = vobject.readOne(event.data)
-                        if hasattr(cal.vevent, 'summary'):
-                            summary = cal.vevent.summary.value
+                        # Two regex extractions beat a full iCalendar parse
+                        # when all we need is the UID and the summary
+                        data = event.data
+                        if isinstance(data, str):
+                            data = data.encode('utf-8')
+
+                        uid_match = _UID_RE.search(data)
+                        if uid_match and uid_match.group(1).decode('utf-8').strip().startswith(f"birthday-{slug}"):
+                            return event
+
+                        summary_match = _SUMMARY_RE.search(data)
+                        if summary_match:
+                            summary = summary_match.group(1).decode('utf-8', errors='replace')
                             if name in summary and (self.event_category.lower() in summary.lower() or 'birthday' in summary.lower()):
                                 return event
-                            if hasattr(cal.vevent, 'uid'):
-                                uid = cal.vevent.uid.value
-                                expected_uid = f"birthday-{name.replace(' ', '-').lower()}"
-                                if uid.startswith(expected_uid):
-                                    return event
                     except Exception as e:
                         logger.debug(f"Error parsing existing event in fallback: {e}")
                         continue
@@ -234,79 +531,128 @@ class CalDAVClient:
                 logger.warning(f"Both new and fallback search methods failed: {fallback_e}")
                 return None
     
-    def _update_existing_event(self, existing_event, contact: Dict, year: int, new_title: str, new_description: str) -> bool:
+    def _update_existing_event(self, existing_event, contact: Dict, year: int, new_title: str, new_description: str, content_hash: str = None) -> bool:
         """Update an existing birthday event with new templates"""
+        name = contact.get('name', 'unknown')
         try:
-            name = contact['name']
             event_date = contact['birthday'].replace(year=year)
-            
+
+            # Cheap steady-state exit: if the stamped content hash matches,
+            # nothing we generate has changed - skip the iCalendar reparse.
+            # Everything below (parse, compare, mutate, PUT) only runs on a
+            # mismatch or for legacy events that were never stamped.
+            if content_hash:
+                data = existing_event.data
+                if isinstance(data, bytes):
+                    data = data.decode('utf-8', errors='replace')
+                if f"X-BDAYSYNC-HASH:{content_hash}" in data:
+                    logger.debug(f"No update needed for {name}'s birthday event (hash match)")
+                    return False
+
             # Parse existing event
-            cal = vobject.readOne(existing_event.data)
-            event = cal.vevent
-            
+            cal = Calendar.from_ical(existing_event.data)
+            event = None
+            for component in cal.walk('VEVENT'):
+                event = component
+                break
+            if event is None:
+                logger.debug(f"No VEVENT found in existing event for {name}")
+                return False
+
             # Check if update is needed
-            current_title = event.summary.value if hasattr(event, 'summary') else ''
-            current_description = event.description.value if hasattr(event, 'description') else ''
-            
-            if current_title == new_title and current_description == new_description:
-                # Check reminders too
-                current_reminders = []
-                if hasattr(event, 'valarm_list'):
-                    for alarm in event.valarm_list:
-                        if hasattr(alarm, 'trigger'):
-                            trigger = alarm.trigger.value
-                            if isinstance(trigger, timedelta):
-                                days = abs(trigger.days)
-                                current_reminders.append(days)
-                
-                current_reminders.sort()
-                expected_reminders = sorted(self.reminder_days)
-                
-                if current_reminders == expected_reminders:
-                    logger.debug(f"No update needed for {name}'s birthday event")
-                    return False
-            
-            logger.info(f"Updating birthday event for {name} on {event_date}")
-            logger.info(f"  Old title: {current_title}")
-            logger.info(f"  New title: {new_title}")
-            
+            current_title = str(event.get('SUMMARY', ''))
+            current_description = str(event.get('DESCRIPTION', ''))
+
+            # The uid-index lookup is date-agnostic, so the event found
+            # may carry an outdated birthday; compare month/day only
+            # (the year differs across sync years for recurring events)
+            dtstart = event.get('DTSTART')
+            current_start = dtstart.dt if dtstart is not None else None
+            if isinstance(current_start, datetime):
+                current_start = current_start.date()
+            date_matches = (current_start is not None and
+                            (current_start.month, current_start.day) ==
+                            (event_date.month, event_date.day))
+
+            # Collect the existing day-offset triggers once; both the
+            # no-op check and the alarm diff below need them
+            existing_triggers = set()
+            for alarm in event.subcomponents:
+                if alarm.name != 'VALARM':
+                    continue
+                trigger = alarm.get('TRIGGER')
+                if trigger is not None and isinstance(trigger.dt, timedelta):
+                    existing_triggers.add(abs(trigger.dt.days))
+
+            desired_triggers = set(self.reminder_days)
+
+            if (current_title == new_title and
+                    current_description == new_description and
+                    date_matches and
+                    existing_triggers == desired_triggers):
+                logger.debug(f"No update needed for {name}'s birthday event")
+                return False
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Updating birthday event for %s on %s", name, event_date)
+                logger.info("  Old title: %s", current_title)
+                logger.info("  New title: %s", new_title)
+
             # Update event properties
-            if hasattr(event, 'summary'):
-                event.summary.value = new_title
-            else:
-                event.add('summary').value = new_title
-                
-            if hasattr(event, 'description'):
-                event.description.value = new_description
-            else:
-                event.add('description').value = new_description
-            
+            for prop, value in (('SUMMARY', new_title), ('DESCRIPTION', new_description)):
+                if prop in event:
+                    del event[prop]
+                event.add(prop, value)
+
             # Update category
-            if hasattr(event, 'categories'):
-                event.categories.value = [self.event_category]
-            else:
-                event.add('categories').value = [self.event_category]
-            
-            # Remove old alarms and add new ones
-            if hasattr(event, 'valarm_list'):
-                for alarm in list(event.valarm_list):
-                    event.remove(alarm)
-            
-            # Add new reminders
-            for days_before in self.reminder_days:
-                alarm = event.add('valarm')
-                alarm.add('action').value = 'DISPLAY'
-                alarm.add('trigger').value = timedelta(days=-days_before)
-                reminder_message = self._format_reminder_message(name, days_before)
-                alarm.add('description').value = reminder_message
-            
-            # Save updated event
-            existing_event.data = cal.serialize()
+            if 'CATEGORIES' in event:
+                del event['CATEGORIES']
+            event.add('categories', [self.event_category])
+
+            # A corrected birthday moves the recurring series itself
+            if not date_matches:
+                for prop, value in (('DTSTART', event_date), ('DTEND', event_date + _ONE_DAY)):
+                    if prop in event:
+                        del event[prop]
+                    event.add(prop, value)
+
+            # Diff the alarms instead of rewriting them all: only touch
+            # the triggers that actually changed
+            if existing_triggers != desired_triggers:
+                stale = existing_triggers - desired_triggers
+                if stale:
+                    kept = []
+                    for component in event.subcomponents:
+                        if component.name == 'VALARM':
+                            trigger = component.get('TRIGGER')
+                            if (trigger is not None and
+                                    isinstance(trigger.dt, timedelta) and
+                                    abs(trigger.dt.days) in stale):
+                                continue
+                        kept.append(component)
+                    event.subcomponents = kept
+
+                for days_before in sorted(desired_triggers - existing_triggers):
+                    alarm = Alarm()
+                    alarm.add('action', 'DISPLAY')
+                    alarm.add('trigger', timedelta(days=-days_before))
+                    alarm.add('description', self._format_reminder_message(name, days_before))
+                    event.add_component(alarm)
+
+            # Re-stamp the content hash so the next run takes the
+            # string-compare fast path instead of re-parsing this event
+            if content_hash:
+                if 'X-BDAYSYNC-HASH' in event:
+                    del event['X-BDAYSYNC-HASH']
+                event.add('X-BDAYSYNC-HASH', content_hash)
+
+            # Save updated event; to_ical() emits folded wire bytes
+            existing_event.data = cal.to_ical().decode('utf-8')
             existing_event.save()
             
-            logger.info(f"Updated birthday event for {name}")
+            logger.info("Updated birthday event for %s", name)
             return True
             
         except Exception as e:
-            logger.error(f"Error updating birthday event for {contact.get('name', 'unknown')}: {e}")
+            logger.error(f"Error updating birthday event for {name}: {e}")
             return False
@@ -2,30 +2,129 @@
 CardDAV client for fetching contacts with birthdays
 """
 
+import json
+import os
 import re
 import logging
-from datetime import datetime
+
+# orjson keeps (de)serializing the ETag cache cheap for very large
+# addressbooks; the stdlib json module is a drop-in fallback
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from typing import List, Dict, Optional
-import vobject
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth, HTTPDigestAuth
+from urllib3.util.retry import Retry
 from urllib.parse import urlparse
+from xml.etree import ElementTree as ET
+from xml.sax.saxutils import escape as xml_escape
 
 logger = logging.getLogger(__name__)
 
+# Clark-notation namespace prefixes for multistatus documents
+_DAV = '{DAV:}'
+_CARDDAV = '{urn:ietf:params:xml:ns:carddav}'
+
+# Compiled once for the regex fallback scanners; recompiling four
+# patterns per PROPFIND response doubles the regex work
+_RESP_RE = re.compile(r'<d:response[^>]*>(.*?)</d:response>', re.DOTALL | re.IGNORECASE)
+_HREF_RE = re.compile(r'<d:href[^>]*>([^<]+)</d:href>', re.IGNORECASE)
+_VCF_RE = re.compile(r'<d:href[^>]*>([^<]*\.vcf)</d:href>', re.IGNORECASE)
+_CT_RE = re.compile(r'<d:getcontenttype[^>]*>([^<]*vcard[^<]*)</d:getcontenttype>', re.IGNORECASE)
+_ADDRESS_DATA_RE = re.compile(r'<(?:[\w-]+:)?address-data[^>]*>(.*?)</(?:[\w-]+:)?address-data>',
+                              re.DOTALL | re.IGNORECASE)
+
+# One pattern covers YYYYMMDD, YYYY-MM-DD, and the year-less --MM-DD
+# form; named strptime formats are much slower than direct construction
+_BDAY_RE = re.compile(r'^(?:(\d{4})-?(\d{2})-?(\d{2})|--(\d{2})-?(\d{2}))$')
+
+# The addressbook PROPFIND never varies, so the headers and body are
+# built once instead of per call
+_PROPFIND_HEADERS = {
+    'Content-Type': 'application/xml; charset=utf-8',
+    'Depth': '1'
+}
+_PROPFIND_BODY = '''<?xml version="1.0" encoding="utf-8" ?>
+<D:propfind xmlns:D="DAV:">
+    <D:prop>
+        <D:getetag />
+        <D:getcontenttype />
+        <D:resourcetype />
+    </D:prop>
+</D:propfind>'''
+
+# Per-resource ETag cache so daily runs only refetch vCards the server
+# actually changed; the PROPFIND already reports every ETag for free
+_ETAG_CACHE_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'bdaysync', 'etags.json')
+
+# Winning auth scheme per host, so later runs try the right one first
+# instead of always burning a 401 round-trip on Basic
+_AUTH_CACHE_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'bdaysync', 'auth.json')
+
+def _vcard_unescape(value: str) -> str:
+    """Undo RFC 6350 TEXT escaping for the few values we extract"""
+    if '\\' not in value:
+        return value
+    return (value.replace('\\n', '\n')
+                 .replace('\\,', ',')
+                 .replace('\\;', ';')
+                 .replace('\\\\', '\\'))
+
 class CardDAVClient:
     """Client for reading contacts from CardDAV server"""
-    
+
+    # vobject is only needed for vCards the line scanner rejects;
+    # importing its parser registry lazily keeps startup cheap for
+    # paths that never parse a contact at all
+    _vobject = None
+
     def __init__(self, server_url: str, username: str, password: str):
         self.server_url = server_url.rstrip('/')
         self.username = username
         self.password = password
-        
+
+        # _resolve_url runs once per href; parse the server URL here
+        # rather than on every call
+        parsed = urlparse(self.server_url)
+        self._netloc = parsed.netloc
+        self._server_prefix = f"{parsed.scheme}://{parsed.netloc}"
+
+        # One pooled session for every request: fetching hundreds of
+        # small .vcf resources is dominated by per-connection TLS and
+        # auth handshakes unless connections are kept alive. The pool
+        # ceiling is tunable so deployments can trade connection count
+        # against server politeness
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=int(os.getenv('CARDAV_POOL_MAXSIZE', '64')),
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
         # Try both Basic and Digest auth
         self.basic_auth = HTTPBasicAuth(username, password)
         self.digest_auth = HTTPDigestAuth(username, password)
         self.auth = None  # Will be set after testing
-        
+
+        # Per-URL {etag, contact} entries from previous runs; unchanged
+        # resources skip the GET entirely
+        self._etag_cache = self._load_etag_cache()
+        self._etag_cache_dirty = False
+
         # Discover addressbooks
         self.addressbook_urls = []
         self._test_auth_and_discover()
@@ -36,33 +135,46 @@ class CardDAVClient:
         logger.info(f"Username: {self.username}")
         
         try:
-            # Test Basic auth first
+            # Try the scheme that worked for this host last run first,
+            # so the common case needs a single PROPFIND
             headers = {'Depth': '1'}
-            response = requests.request('PROPFIND', self.server_url, 
-                                      auth=self.basic_auth, headers=headers, timeout=10)
-            logger.info(f"Basic auth response: {response.status_code}")
-            
-            if response.status_code in [200, 207]:
-                logger.info("Basic authentication successful!")
-                self.auth = self.basic_auth
-            elif response.status_code == 401:
-                # Try Digest auth
-                logger.info("Basic auth failed, trying Digest authentication...")
-                response = requests.request('PROPFIND', self.server_url, 
-                                          auth=self.digest_auth, headers=headers, timeout=10)
-                logger.info(f"Digest auth response: {response.status_code}")
-                
+            attempts = [('basic', self.basic_auth), ('digest', self.digest_auth)]
+            cached_scheme = self._load_auth_scheme()
+            if cached_scheme == 'digest':
+                attempts.reverse()
+
+            response = None
+            winning_scheme = None
+            for scheme, auth in attempts:
+                response = self.session.request('PROPFIND', self.server_url,
+                                                auth=auth, headers=headers, timeout=10)
+                logger.info("%s auth response: %s", scheme.capitalize(), response.status_code)
+
                 if response.status_code in [200, 207]:
-                    logger.info("Digest authentication successful!")
-                    self.auth = self.digest_auth
-                else:
+                    logger.info("%s authentication successful!", scheme.capitalize())
+                    self.auth = auth
+                    winning_scheme = scheme
+                    break
+                elif response.status_code != 401:
                     raise Exception(f"Authentication failed: {response.status_code}")
+                logger.info("%s auth rejected (401)", scheme.capitalize())
             else:
                 raise Exception(f"Authentication failed: {response.status_code}")
-            
-            # Now discover addressbooks from the response
-            logger.debug(f"Discovery response: {response.text[:1000]}...")
-            self.addressbook_urls = self._extract_addressbooks(response.text)
+
+            if winning_scheme != cached_scheme:
+                self._save_auth_scheme(winning_scheme)
+
+            # Bind the winning auth to the session so later calls skip
+            # the per-request auth negotiation; for Digest the session
+            # also keeps the cached challenge alive
+            self.session.auth = self.auth
+
+            # Now discover addressbooks from the response. WebDAV bodies
+            # are UTF-8; pinning the encoding skips chardet detection
+            response.encoding = 'utf-8'
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Discovery response: {response.text[:1000]}...")
+            self.addressbook_urls = self._extract_addressbooks(response.content)
             
             if not self.addressbook_urls:
                 # If no addressbooks found, maybe this URL IS an addressbook
@@ -83,54 +195,166 @@ class CardDAVClient:
             logger.error(f"Error during authentication and discovery: {e}")
             raise
     
-    def _extract_addressbooks(self, xml_response: str) -> List[str]:
-        """Extract addressbook collection URLs from PROPFIND response"""
+    def _extract_addressbooks(self, xml_response) -> List[str]:
+        """Extract addressbook collection URLs from PROPFIND response (str or bytes)"""
+        try:
+            root = ET.fromstring(xml_response)
+        except ET.ParseError as e:
+            logger.debug(f"Multistatus XML did not parse, falling back to regex scan: {e}")
+            if isinstance(xml_response, bytes):
+                xml_response = xml_response.decode('utf-8', errors='replace')
+            return self._extract_addressbooks_regex(xml_response)
+
         addressbooks = []
-        
+        server_url_slash = self.server_url + '/'
+
+        # One tree walk associates each href with its own resourcetype,
+        # replacing the per-block regex passes over the whole body
+        for response in root.iter(f'{_DAV}response'):
+            href_element = response.find(f'{_DAV}href')
+            if href_element is None or not href_element.text:
+                continue
+
+            href = href_element.text.strip()
+            logger.debug("Found href: %s", href)
+
+            if response.find(f'.//{_CARDDAV}addressbook') is None:
+                continue
+
+            # Skip the parent directory itself
+            if href != self.server_url and href != server_url_slash:
+                full_url = self._resolve_url(href)
+                addressbooks.append(full_url)
+                logger.debug("Found addressbook: %s", full_url)
+
+        return addressbooks
+
+    def _extract_addressbooks_regex(self, xml_response: str) -> List[str]:
+        """Regex fallback for multistatus bodies ElementTree cannot parse"""
+        addressbooks = []
+        server_url_slash = self.server_url + '/'
+
         # Find all response blocks
-        response_pattern = r'<d:response[^>]*>(.*?)</d:response>'
-        responses = re.findall(response_pattern, xml_response, re.DOTALL | re.IGNORECASE)
-        
-        for response_block in responses:
+        for response_block in _RESP_RE.findall(xml_response):
             # Extract href from this response block
-            href_match = re.search(r'<d:href[^>]*>([^<]+)</d:href>', response_block, re.IGNORECASE)
+            href_match = _HREF_RE.search(response_block)
             if not href_match:
                 continue
-                
+
             href = href_match.group(1).strip()
-            logger.debug(f"Found href: {href}")
-            
-            # Check if this response contains addressbook resourcetype
-            if ('card:addressbook' in response_block or 
-                'addressbook' in response_block.lower() and 
-                '<d:collection' in response_block):
-                
+            logger.debug("Found href: %s", href)
+
+            # Check the cheap exact marker first; only lowercase the
+            # whole block (it can be several KB) when that misses
+            if ('card:addressbook' in response_block or
+                    ('<d:collection' in response_block and
+                     'addressbook' in response_block.lower())):
+
                 # Skip the parent directory itself
-                if href != self.server_url and href != self.server_url + '/':
+                if href != self.server_url and href != server_url_slash:
                     full_url = self._resolve_url(href)
                     addressbooks.append(full_url)
-                    logger.debug(f"Found addressbook: {full_url}")
+                    logger.debug("Found addressbook: %s", full_url)
         
         return addressbooks
     
     def _is_addressbook(self, xml_response: str) -> bool:
         """Check if the response indicates this URL is an addressbook collection"""
-        return ('card:addressbook' in xml_response or 
-                ('addressbook' in xml_response.lower() and 
-                 '<d:collection' in xml_response))
+        return ('card:addressbook' in xml_response or
+                ('<d:collection' in xml_response and
+                 'addressbook' in xml_response.lower()))
     
     def get_contacts(self) -> List[Dict]:
         """Fetch all contacts from all discovered addressbooks"""
         all_contacts = []
-        
+
         for addressbook_url in self.addressbook_urls:
-            logger.info(f"Processing addressbook: {addressbook_url}")
+            logger.info("Processing addressbook: %s", addressbook_url)
             contacts = self._get_contacts_from_addressbook(addressbook_url)
             all_contacts.extend(contacts)
-            logger.info(f"Found {len(contacts)} contacts with birthdays in this addressbook")
-        
-        logger.info(f"Total contacts with birthdays across all addressbooks: {len(all_contacts)}")
+            logger.info("Found %d contacts with birthdays in this addressbook", len(contacts))
+
+        logger.info("Total contacts with birthdays across all addressbooks: %d", len(all_contacts))
+        self._flush_etag_cache()
         return all_contacts
+
+    def _load_etag_cache(self) -> Dict:
+        """Load the per-resource ETag cache from previous runs"""
+        try:
+            with open(_ETAG_CACHE_PATH, 'rb') as f:
+                cache = _json_loads(f.read())
+            logger.debug("Loaded ETag cache with %d entries", len(cache))
+            return cache
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not load ETag cache, starting fresh: {e}")
+            return {}
+
+    def _flush_etag_cache(self):
+        """Persist the ETag cache if this run changed it"""
+        if not self._etag_cache_dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(_ETAG_CACHE_PATH), exist_ok=True)
+            with open(_ETAG_CACHE_PATH, 'wb') as f:
+                f.write(_json_dumps(self._etag_cache))
+            self._etag_cache_dirty = False
+            logger.debug("Flushed ETag cache with %d entries", len(self._etag_cache))
+        except OSError as e:
+            logger.warning(f"Could not write ETag cache: {e}")
+
+    def _load_auth_scheme(self) -> Optional[str]:
+        """Return the auth scheme ('basic'/'digest') that last worked for this host"""
+        try:
+            with open(_AUTH_CACHE_PATH, 'rb') as f:
+                return _json_loads(f.read()).get(self._netloc)
+        except (OSError, ValueError):
+            return None
+
+    def _save_auth_scheme(self, scheme: str):
+        """Remember the winning auth scheme for this host"""
+        try:
+            with open(_AUTH_CACHE_PATH, 'rb') as f:
+                cache = _json_loads(f.read())
+        except (OSError, ValueError):
+            cache = {}
+        cache[self._netloc] = scheme
+        try:
+            os.makedirs(os.path.dirname(_AUTH_CACHE_PATH), exist_ok=True)
+            with open(_AUTH_CACHE_PATH, 'wb') as f:
+                f.write(_json_dumps(cache))
+        except OSError as e:
+            logger.debug(f"Could not write auth scheme cache: {e}")
+
+    def _cache_contact(self, full_url: str, etag: str, contact: Optional[Dict]):
+        """Record the parsed result for a resource under its current ETag
+
+        Contacts without a birthday are cached as None so the next run
+        skips their fetch too.
+        """
+        if not etag:
+            return
+        entry = {'etag': etag, 'contact': None}
+        if contact:
+            entry['contact'] = {
+                'name': contact['name'],
+                'birthday': contact['birthday'].isoformat(),
+            }
+        self._etag_cache[full_url] = entry
+        self._etag_cache_dirty = True
+
+    @staticmethod
+    def _contact_from_cache(entry: Dict, addressbook_url: str) -> Optional[Dict]:
+        """Rebuild a contact dict from a cache entry, or None for no-birthday"""
+        cached = entry.get('contact')
+        if not cached:
+            return None
+        return {
+            'name': cached['name'],
+            'birthday': date.fromisoformat(cached['birthday']),
+            'addressbook': addressbook_url,
+        }
     
     def _get_contacts_from_addressbook(self, addressbook_url: str) -> List[Dict]:
         """Fetch contacts from a specific addressbook"""
@@ -138,60 +362,102 @@ class CardDAVClient:
         
         try:
             # Simple PROPFIND to get all resources in this addressbook
-            headers = {
-                'Content-Type': 'application/xml; charset=utf-8',
-                'Depth': '1'
-            }
-            
-            propfind_body = '''<?xml version="1.0" encoding="utf-8" ?>
-            <D:propfind xmlns:D="DAV:">
-                <D:prop>
-                    <D:getetag />
-                    <D:getcontenttype />
-                    <D:resourcetype />
-                </D:prop>
-            </D:propfind>'''
-            
             logger.debug(f"Discovering resources in addressbook: {addressbook_url}")
-            response = requests.request('PROPFIND', addressbook_url, 
-                                      auth=self.auth, headers=headers, data=propfind_body)
+            response = self.session.request('PROPFIND', addressbook_url,
+                                            headers=_PROPFIND_HEADERS, data=_PROPFIND_BODY)
             
             logger.debug(f"PROPFIND response status: {response.status_code}")
-            
+
             if response.status_code in [200, 207]:
-                logger.debug(f"Raw XML response preview: {response.text[:500]}...")
-                
-                # Parse the response to find vCard resources
-                vcard_urls = self._extract_vcard_urls(response.text)
-                logger.info(f"Found {len(vcard_urls)} vCard resources in {addressbook_url}")
-                
-                if not vcard_urls:
+                response.encoding = 'utf-8'
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Raw XML response preview: {response.text[:500]}...")
+
+                # Parse the response to find vCard resources; bytes feed
+                # ElementTree directly without an intermediate decode
+                resources = self._extract_vcard_resources(response.content)
+                logger.info(f"Found {len(resources)} vCard resources in {addressbook_url}")
+
+                if not resources:
                     logger.debug("No vCard URLs found in this addressbook")
                     return contacts
-                
-                # Fetch each vCard
-                for i, vcard_url in enumerate(vcard_urls):
-                    try:
-                        full_url = self._resolve_url(vcard_url)
-                        logger.debug(f"Fetching vCard {i+1}/{len(vcard_urls)} from: {full_url}")
-                        
-                        vcard_response = requests.get(full_url, auth=self.auth, timeout=10)
-                        logger.debug(f"vCard response status: {vcard_response.status_code}")
-                        
-                        if vcard_response.status_code == 200:
-                            logger.debug(f"vCard content preview: {vcard_response.text[:200]}...")
-                            contact = self._parse_vcard(vcard_response.text)
-                            if contact:
-                                contact['addressbook'] = addressbook_url
-                                contacts.append(contact)
-                                logger.info(f"✓ Parsed contact: {contact['name']} (Birthday: {contact.get('birthday', 'None')}) from {addressbook_url}")
-                            else:
-                                logger.debug(f"No birthday found in vCard: {vcard_url}")
-                        else:
-                            logger.warning(f"Failed to fetch vCard {vcard_url}: {vcard_response.status_code}")
-                    except Exception as e:
-                        logger.warning(f"Error processing vCard {vcard_url}: {e}")
+
+                # Serve unchanged resources from the ETag cache; only the
+                # delta since the last run needs fetching at all
+                stale = []
+                etag_by_url = {}
+                for href, etag in resources:
+                    full_url = self._resolve_url(href)
+                    etag_by_url[full_url] = etag
+                    cached = self._etag_cache.get(full_url) if etag else None
+                    if cached and cached.get('etag') == etag:
+                        contact = self._contact_from_cache(cached, addressbook_url)
+                        if contact:
+                            contacts.append(contact)
                         continue
+                    stale.append((href, full_url))
+
+                if not stale:
+                    logger.info(f"All {len(resources)} vCards unchanged since last run")
+                    return contacts
+                logger.info("Fetching %d changed vCards (%d served from ETag cache)",
+                            len(stale), len(resources) - len(stale))
+
+                # Prefer one multiget REPORT per batch over N GETs; fall
+                # back to the concurrent per-resource fetch when the
+                # server does not support the REPORT
+                vcard_bodies = self._fetch_vcards_multiget(
+                    addressbook_url, [href for href, _ in stale])
+
+                if vcard_bodies is not None:
+                    returned = set()
+                    for href, vcard_text in vcard_bodies:
+                        full_url = self._resolve_url(href) if href else None
+                        if full_url:
+                            returned.add(full_url)
+                        self._collect_contact(vcard_text, addressbook_url, contacts,
+                                              full_url, etag_by_url.get(full_url))
+
+                    # A 207 can carry per-href error statuses instead of
+                    # bodies; GET those leftovers individually rather
+                    # than silently dropping them. When the regex
+                    # fallback produced unpaired bodies the accounting
+                    # is impossible, so skip it
+                    if all(href for href, _ in vcard_bodies):
+                        missing = [fu for _, fu in stale if fu not in returned]
+                        if missing:
+                            logger.warning("multiget returned no body for %d of %d resources, fetching them individually",
+                                           len(missing), len(stale))
+                            for result in map(self._fetch_vcard, missing):
+                                if result is None:
+                                    continue
+                                full_url, status_code, vcard_text = result
+                                if status_code == 200:
+                                    self._collect_contact(vcard_text, addressbook_url, contacts,
+                                                          full_url, etag_by_url.get(full_url))
+                                else:
+                                    logger.warning(f"Failed to fetch vCard {full_url}: {status_code}")
+                else:
+                    # Fetch vCards concurrently; the work is I/O-bound,
+                    # so a small thread pool over the shared session
+                    # hides the per-request round-trip latency
+                    full_urls = [full_url for _, full_url in stale]
+                    workers = min(int(os.getenv('CARDAV_FETCH_WORKERS', '8')), len(full_urls))
+
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        # Parsing stays in this thread; vobject is not
+                        # guaranteed thread-safe
+                        for result in executor.map(self._fetch_vcard, full_urls):
+                            if result is None:
+                                continue
+                            full_url, status_code, vcard_text = result
+                            if status_code == 200:
+                                if logger.isEnabledFor(logging.DEBUG):
+                                    logger.debug(f"vCard content preview: {vcard_text[:200]}...")
+                                self._collect_contact(vcard_text, addressbook_url, contacts,
+                                                      full_url, etag_by_url.get(full_url))
+                            else:
+                                logger.warning(f"Failed to fetch vCard {full_url}: {status_code}")
             else:
                 logger.error(f"Failed to discover resources in {addressbook_url}: {response.status_code}")
                 logger.error(f"Response: {response.text[:500]}")
@@ -204,43 +470,177 @@ class CardDAVClient:
         
         return contacts
     
-    def _extract_vcard_urls(self, xml_response: str) -> List[str]:
-        """Extract vCard URLs from PROPFIND response"""
+    def _collect_contact(self, vcard_text: str, addressbook_url: str, contacts: List[Dict],
+                         full_url: Optional[str] = None, etag: Optional[str] = None):
+        """Parse one vCard body and append it if it carries a birthday"""
+        # Most contacts have no BDAY at all; a substring check skips
+        # the whole parser (and still caches the negative result) for
+        # bodies that cannot possibly yield a birthday. Property names
+        # are case-insensitive, so normalize before testing
+        if 'BDAY' not in vcard_text.upper():
+            if full_url:
+                self._cache_contact(full_url, etag, None)
+            return
+
+        contact = self._parse_vcard(vcard_text)
+        if full_url:
+            self._cache_contact(full_url, etag, contact)
+        if contact:
+            contact['addressbook'] = addressbook_url
+            contacts.append(contact)
+            logger.info("✓ Parsed contact: %s (Birthday: %s) from %s", contact['name'], contact.get('birthday'), addressbook_url)
+
+    def _fetch_vcards_multiget(self, addressbook_url: str, vcard_urls: List[str]) -> Optional[List[tuple]]:
+        """Fetch vCard bodies with addressbook-multiget REPORTs
+
+        Collapses the per-resource GETs into one REPORT per batch of 100
+        hrefs. Returns (href, body) pairs, or None when the server
+        rejects the REPORT so the caller can fall back to individual
+        GETs.
+        """
+        bodies = []
+        batch_size = 100
+
+        try:
+            for start in range(0, len(vcard_urls), batch_size):
+                batch = vcard_urls[start:start + batch_size]
+                hrefs = ''.join(f'<d:href>{xml_escape(href)}</d:href>' for href in batch)
+                report_body = (
+                    '<?xml version="1.0" encoding="utf-8" ?>'
+                    '<card:addressbook-multiget xmlns:d="DAV:" xmlns:card="urn:ietf:params:xml:ns:carddav">'
+                    '<d:prop><d:getetag/><card:address-data/></d:prop>'
+                    f'{hrefs}'
+                    '</card:addressbook-multiget>'
+                )
+                response = self.session.request(
+                    'REPORT', addressbook_url,
+                    headers={'Content-Type': 'application/xml; charset=utf-8', 'Depth': '1'},
+                    data=report_body, timeout=30
+                )
+
+                if response.status_code not in [200, 207]:
+                    logger.debug(f"addressbook-multiget not usable ({response.status_code}), falling back to GETs")
+                    return None
+
+                bodies.extend(self._extract_address_data(response.content))
+
+            logger.info(f"Fetched {len(bodies)} vCards via addressbook-multiget from {addressbook_url}")
+            return bodies
+
+        except Exception as e:
+            logger.debug(f"addressbook-multiget failed, falling back to GETs: {e}")
+            return None
+
+    def _extract_address_data(self, xml_response) -> List[tuple]:
+        """Extract (href, vCard body) pairs from a multiget response (str or bytes)"""
+        try:
+            root = ET.fromstring(xml_response)
+        except ET.ParseError as e:
+            logger.debug(f"Multistatus XML did not parse, falling back to regex scan: {e}")
+            if isinstance(xml_response, bytes):
+                xml_response = xml_response.decode('utf-8', errors='replace')
+            return self._extract_address_data_regex(xml_response)
+
+        # Walk per response so each body stays paired with its href;
+        # ElementTree already unescapes the element text for us
+        pairs = []
+        for response in root.iter(f'{_DAV}response'):
+            data = response.find(f'.//{_CARDDAV}address-data')
+            if data is None or not data.text or not data.text.strip():
+                continue
+            href_element = response.find(f'{_DAV}href')
+            href = href_element.text.strip() if href_element is not None and href_element.text else None
+            pairs.append((href, data.text.strip()))
+        return pairs
+
+    def _extract_address_data_regex(self, xml_response: str) -> List[tuple]:
+        """Regex fallback for multistatus bodies ElementTree cannot parse"""
+        import html
+
+        blocks = _ADDRESS_DATA_RE.findall(xml_response)
+        # The bodies are XML-escaped inside the multistatus envelope;
+        # the fallback cannot pair hrefs reliably, so it leaves them out
+        return [(None, html.unescape(block).strip()) for block in blocks if block.strip()]
+
+    def _fetch_vcard(self, full_url: str):
+        """Fetch one vCard body; returns (url, status, text) or None on error"""
+        try:
+            logger.debug("Fetching vCard from: %s", full_url)
+            response = self.session.get(full_url, timeout=10)
+            # vCards are UTF-8 per RFC 6350; skip chardet detection
+            response.encoding = 'utf-8'
+            return full_url, response.status_code, response.text
+        except Exception as e:
+            logger.warning(f"Error fetching vCard {full_url}: {e}")
+            return None
+
+    def _extract_vcard_resources(self, xml_response) -> List[tuple]:
+        """Extract (href, etag) pairs for vCard resources from a PROPFIND response"""
+        try:
+            root = ET.fromstring(xml_response)
+        except ET.ParseError as e:
+            logger.debug(f"Multistatus XML did not parse, falling back to regex scan: {e}")
+            if isinstance(xml_response, bytes):
+                xml_response = xml_response.decode('utf-8', errors='replace')
+            return self._extract_vcard_urls_regex(xml_response)
+
+        resources = []
+
+        for response in root.iter(f'{_DAV}response'):
+            href_element = response.find(f'{_DAV}href')
+            if href_element is None or not href_element.text:
+                continue
+
+            href = href_element.text.strip()
+            if not href or href.endswith('/'):
+                continue
+
+            # The tree gives each href its own getcontenttype and
+            # getetag for free
+            content_type = response.find(f'.//{_DAV}getcontenttype')
+            if href.endswith('.vcf') or (content_type is not None and
+                                         content_type.text and
+                                         'vcard' in content_type.text.lower()):
+                etag_element = response.find(f'.//{_DAV}getetag')
+                etag = etag_element.text.strip() if etag_element is not None and etag_element.text else None
+                resources.append((href, etag))
+                logger.debug("Found vCard URL: %s", href)
+
+        logger.info("Extracted %d vCard URLs", len(resources))
+        return resources
+
+    def _extract_vcard_urls_regex(self, xml_response: str) -> List[tuple]:
+        """Regex fallback for multistatus bodies ElementTree cannot parse
+
+        Returns (href, etag) pairs; the fallback does not associate
+        ETags, so they come back as None and those resources are always
+        fetched.
+        """
         urls = []
-        
+
         # Find all href elements containing .vcf files
-        vcf_pattern = r'<d:href[^>]*>([^<]*\.vcf)</d:href>'
-        vcf_matches = re.findall(vcf_pattern, xml_response, re.IGNORECASE)
-        
-        for url in vcf_matches:
+        for url in _VCF_RE.findall(xml_response):
             url = url.strip()
             if url:
                 urls.append(url)
-                logger.debug(f"Found vCard URL: {url}")
-        
-        # Also try a more general pattern for any vcard content type
-        href_pattern = r'<d:href[^>]*>([^<]+)</d:href>'
-        content_type_pattern = r'<d:getcontenttype[^>]*>([^<]*vcard[^<]*)</d:getcontenttype>'
-        
-        href_matches = re.findall(href_pattern, xml_response, re.IGNORECASE)
-        content_matches = re.findall(content_type_pattern, xml_response, re.IGNORECASE)
-        
-        # If we found content type matches, try to match them with hrefs
-        if content_matches and not urls:
-            for href in href_matches:
-                href = href.strip()
+                logger.debug("Found vCard URL: %s", url)
+
+        # Also try a more general pattern for any vcard content type.
+        # finditer keeps each match's position, so the "is there a vcard
+        # content type near this href" check is one bounded window scan
+        # per href instead of a re-search of the whole body
+        if not urls and _CT_RE.search(xml_response):
+            lowered = xml_response.lower()
+            for match in _HREF_RE.finditer(xml_response):
+                href = match.group(1).strip()
                 if not href.endswith('/') and not href.endswith('.vcf'):
-                    # Check if this href appears near a vcard content type
-                    href_index = xml_response.find(f'<d:href>{href}</d:href>')
-                    if href_index > 0:
-                        # Look for vcard content type within 500 chars after href
-                        nearby_text = xml_response[href_index:href_index + 500]
-                        if 'vcard' in nearby_text.lower():
-                            urls.append(href)
-                            logger.debug(f"Found vCard URL by content type: {href}")
-        
-        logger.info(f"Extracted {len(urls)} vCard URLs")
-        return urls
+                    # Look for a vcard content type within 500 chars after href
+                    if lowered.find('vcard', match.end(), match.end() + 500) != -1:
+                        urls.append(href)
+                        logger.debug("Found vCard URL by content type: %s", href)
+
+        logger.info("Extracted %d vCard URLs", len(urls))
+        return [(url, None) for url in urls]
     
     def _resolve_url(self, url: str) -> str:
         """Resolve relative URL to absolute URL"""
@@ -248,72 +648,154 @@ class CardDAVClient:
             # Already absolute
             return url
         elif url.startswith('/'):
-            # Absolute path - combine with scheme and host from server_url
-            parsed = urlparse(self.server_url)
-            return f"{parsed.scheme}://{parsed.netloc}{url}"
+            # Absolute path - combine with the precomputed scheme://host
+            return self._server_prefix + url
         else:
             # Relative path - append to server_url
-            return f"{self.server_url.rstrip('/')}/{url.lstrip('/')}"
+            return f"{self.server_url}/{url.lstrip('/')}"
     
     def _parse_vcard(self, vcard_text: str) -> Optional[Dict]:
         """Parse individual vCard"""
+        # Clean up the vCard text
+        vcard_text = vcard_text.strip()
+        if not vcard_text.startswith('BEGIN:VCARD'):
+            logger.debug("Invalid vCard: doesn't start with BEGIN:VCARD")
+            return None
+
+        # The scanner only reads FN/N/BDAY and skips everything else
+        # (ADR, EMAIL, PHOTO blobs, ...) that a full parse would build
         try:
-            # Clean up the vCard text
-            vcard_text = vcard_text.strip()
-            if not vcard_text.startswith('BEGIN:VCARD'):
-                logger.debug("Invalid vCard: doesn't start with BEGIN:VCARD")
-                return None
-            
-            vcard = vobject.readOne(vcard_text)
+            return self._scan_vcard(vcard_text)
+        except Exception as e:
+            logger.debug(f"vCard line scan failed, falling back to vobject: {e}")
+            return self._parse_vcard_vobject(vcard_text)
+
+    def _scan_vcard(self, vcard_text: str) -> Optional[Dict]:
+        """Single-pass line scanner for the three properties we need"""
+        fn_name = None
+        n_name = None
+        bday_raw = None
+
+        # Unfold RFC 6350 continuation lines (leading space or tab).
+        # Most vCards carry no folded lines at all, so check for the
+        # fold markers once instead of testing every line
+        if '\n ' not in vcard_text and '\n\t' not in vcard_text:
+            unfolded = vcard_text.splitlines()
+        else:
+            unfolded = []
+            for line in vcard_text.splitlines():
+                if line[:1] in (' ', '\t') and unfolded:
+                    unfolded[-1] += line[1:]
+                else:
+                    unfolded.append(line)
+
+        for line in unfolded:
+            head, sep, value = line.partition(':')
+            if not sep:
+                continue
+
+            # Property names are case-insensitive and may carry a
+            # group prefix like 'item1.BDAY' (RFC 6350); normalize the
+            # name (sans parameters) before matching
+            prop = head.split(';', 1)[0]
+            if '.' in prop:
+                prop = prop.rpartition('.')[2]
+            prop = prop.upper()
+
+            if fn_name is None and prop == 'FN':
+                fn_name = _vcard_unescape(value.strip())
+            elif bday_raw is None and prop == 'BDAY':
+                bday_raw = value.strip()
+            elif n_name is None and prop == 'N':
+                parts = value.split(';')
+                given = parts[1].strip() if len(parts) > 1 else ''
+                family = parts[0].strip() if parts else ''
+                joined = ' '.join(p for p in (given, family) if p)
+                n_name = _vcard_unescape(joined) if joined else None
+
+        contact = {'name': fn_name or n_name or 'Unknown'}
+
+        if not bday_raw:
+            logger.debug("No birthday found for contact: %s", contact['name'])
+            return None
+
+        birthday = self._parse_birthday(bday_raw, contact['name'])
+        if birthday is None:
+            return None
+
+        contact['birthday'] = birthday
+        logger.debug("Successfully parsed contact: %s - %s", contact['name'], contact['birthday'])
+        return contact
+
+    def _parse_birthday(self, bday: str, name: str):
+        """Parse a BDAY string into a date (various formats)"""
+        try:
+            # Remove any time zone info or extra characters
+            bday_clean = bday.strip().split('T')[0]  # Remove time part
+
+            match = _BDAY_RE.match(bday_clean)
+            if match:
+                year, month, day, noyear_month, noyear_day = match.groups()
+                if year:
+                    return date(int(year), int(month), int(day))
+                # Recurring date without year, use a placeholder year
+                return date(2000, int(noyear_month), int(noyear_day))
+
+            if '/' in bday_clean:  # MM/DD/YYYY or DD/MM/YYYY
+                # Try both formats
+                try:
+                    return datetime.strptime(bday_clean, '%m/%d/%Y').date()
+                except ValueError:
+                    return datetime.strptime(bday_clean, '%d/%m/%Y').date()
+
+            logger.warning(f"Unknown birthday format for {name}: {bday}")
+            return None
+
+        except ValueError as e:
+            logger.warning(f"Could not parse birthday for {name}: {bday} - {e}")
+            return None
+
+    def _parse_vcard_vobject(self, vcard_text: str) -> Optional[Dict]:
+        """Full vobject parse, kept as fallback for vCards the scanner rejects"""
+        if CardDAVClient._vobject is None:
+            import vobject
+            CardDAVClient._vobject = vobject
+        try:
+            vcard = CardDAVClient._vobject.readOne(vcard_text)
             contact = {}
-            
+
+            # vobject exposes properties as a plain dict of lists keyed
+            # by lowercase name; direct lookups skip the __getattr__
+            # machinery that each hasattr probe would run
+            props = vcard.contents
+            fn = props.get('fn')
+            n_prop = props.get('n')
+            bday_prop = props.get('bday')
+
             # Extract name
-            if hasattr(vcard, 'fn'):
-                contact['name'] = vcard.fn.value.strip()
-            elif hasattr(vcard, 'n'):
-                n = vcard.n.value
+            if fn:
+                contact['name'] = fn[0].value.strip()
+            elif n_prop:
+                n = n_prop[0].value
                 name_parts = []
-                if hasattr(n, 'given') and n.given:
+                if getattr(n, 'given', None):
                     name_parts.append(n.given)
-                if hasattr(n, 'family') and n.family:
+                if getattr(n, 'family', None):
                     name_parts.append(n.family)
                 contact['name'] = ' '.join(name_parts) if name_parts else 'Unknown'
             else:
                 contact['name'] = 'Unknown'
-            
+
             # Extract birthday
-            if hasattr(vcard, 'bday'):
-                bday = vcard.bday.value
+            if bday_prop:
+                bday = bday_prop[0].value
                 logger.debug(f"Raw birthday value for {contact['name']}: {bday} (type: {type(bday)})")
                 
                 if isinstance(bday, str):
-                    # Parse date string (various formats)
-                    try:
-                        # Remove any time zone info or extra characters
-                        bday_clean = bday.strip().split('T')[0]  # Remove time part
-                        
-                        if len(bday_clean) == 8 and bday_clean.isdigit():  # YYYYMMDD
-                            contact['birthday'] = datetime.strptime(bday_clean, '%Y%m%d').date()
-                        elif len(bday_clean) == 10 and bday_clean.count('-') == 2:  # YYYY-MM-DD
-                            contact['birthday'] = datetime.strptime(bday_clean, '%Y-%m-%d').date()
-                        elif len(bday_clean) == 10 and bday_clean.count('/') == 2:  # MM/DD/YYYY or DD/MM/YYYY
-                            # Try both formats
-                            try:
-                                contact['birthday'] = datetime.strptime(bday_clean, '%m/%d/%Y').date()
-                            except ValueError:
-                                contact['birthday'] = datetime.strptime(bday_clean, '%d/%m/%Y').date()
-                        elif bday_clean.startswith('--'):  # --MM-DD format (no year)
-                            # This is a recurring date without year, use current year as placeholder
-                            month_day = bday_clean[2:]  # Remove --
-                            contact['birthday'] = datetime.strptime(f"2000-{month_day}", '%Y-%m-%d').date()
-                        else:
-                            logger.warning(f"Unknown birthday format for {contact['name']}: {bday}")
-                            return None
-                            
-                    except ValueError as e:
-                        logger.warning(f"Could not parse birthday for {contact['name']}: {bday} - {e}")
+                    birthday = self._parse_birthday(bday, contact['name'])
+                    if birthday is None:
                         return None
-                        
+                    contact['birthday'] = birthday
                 elif hasattr(bday, 'date'):
                     contact['birthday'] = bday.date()
                 elif hasattr(bday, 'year'):  # datetime object
@@ -328,10 +810,10 @@ class CardDAVClient:
             
             # Only return contacts that have birthdays
             if 'birthday' in contact:
-                logger.debug(f"Successfully parsed contact: {contact['name']} - {contact['birthday']}")
+                logger.debug("Successfully parsed contact: %s - %s", contact['name'], contact['birthday'])
                 return contact
             else:
-                logger.debug(f"No birthday found for contact: {contact['name']}")
+                logger.debug("No birthday found for contact: %s", contact['name'])
                 return None
             
         except Exception as e:
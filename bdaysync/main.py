@@ -10,28 +10,30 @@ import logging
 import argparse
 from datetime import datetime
 
-from cardav_client import CardDAVClient
-from caldav_client import CalDAVClient
-from scheduler import SchedulerService
 from config import setup_logging, validate_environment
 
-# ASCII Art Banner
-BANNER = """
+# The client and scheduler modules pull in caldav/vobject/croniter;
+# they are imported inside the functions that need them so fast paths
+# like --health-check stay on requests + stdlib
+
+def _banner() -> str:
+    """Build the ASCII art banner; only allocated when actually printed"""
+    return """
 ██████╗ ██████╗  █████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗
 ██╔══██╗██╔══██╗██╔══██╗╚██╗ ██╔╝██╔════╝╚██╗ ██╔╝████╗  ██║██╔════╝
-██████╔╝██║  ██║███████║ ╚████╔╝ ███████╗ ╚████╔╝ ██╔██╗ ██║██║     
-██╔══██╗██║  ██║██╔══██║  ╚██╔╝  ╚════██║  ╚██╔╝  ██║╚██╗██║██║     
+██████╔╝██║  ██║███████║ ╚████╔╝ ███████╗ ╚████╔╝ ██╔██╗ ██║██║
+██╔══██╗██║  ██║██╔══██║  ╚██╔╝  ╚════██║  ╚██╔╝  ██║╚██╗██║██║
 ██████╔╝██████╔╝██║  ██║   ██║   ███████║   ██║   ██║ ╚████║╚██████╗
 ╚═════╝ ╚═════╝ ╚═╝  ╚═╝   ╚═╝   ╚══════╝   ╚═╝   ╚═╝  ╚═══╝ ╚═════╝
-                🎂 Birthday Sync Service 🎂                                                    
+                🎂 Birthday Sync Service 🎂
             CardDAV to CalDAV Birthday Synchronization
 """
 
 def print_banner():
     """Print the ASCII art banner"""
-    print(BANNER)
+    print(_banner())
     print(f"Version: {os.getenv('VERSION', '1.0.0')}")
-    print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S %Z')}")
+    print(f"Started: {datetime.now().isoformat(timespec='seconds')}")
     print("─" * 62)
     print()
 
@@ -52,6 +54,7 @@ def diagnose_cardav():
     
     try:
         # Test the discovery approach
+        from cardav_client import CardDAVClient
         client = CardDAVClient(cardav_url, cardav_username, cardav_password)
         print(f"✓ Authentication successful!")
         print(f"✓ Found {len(client.addressbook_urls)} addressbooks:")
@@ -61,9 +64,12 @@ def diagnose_cardav():
         # Test fetching contacts
         contacts = client.get_contacts()
         print(f"✓ Total contacts with birthdays: {len(contacts)}")
-        
+
+        # Derive each addressbook's display name once, not per contact
+        ab_names = {ab_url: ab_url.rstrip('/').split('/')[-1]
+                    for ab_url in client.addressbook_urls}
         for contact in contacts:
-            ab_name = contact.get('addressbook', 'unknown').split('/')[-1] or contact.get('addressbook', 'unknown').split('/')[-2]
+            ab_name = ab_names.get(contact.get('addressbook'), 'unknown')
             print(f"  - {contact['name']} ({contact['birthday']}) from '{ab_name}'")
         
         return True
@@ -78,6 +84,9 @@ def main_sync():
     
     try:
         # Initialize clients
+        from cardav_client import CardDAVClient
+        from caldav_client import CalDAVClient
+
         logger.info("Connecting to CardDAV server...")
         cardav_client = CardDAVClient(
             os.getenv('CARDAV_SERVER_URL'),
@@ -100,22 +109,21 @@ def main_sync():
             logger.warning("No contacts with birthdays found")
             return False
         
-        logger.info(f"Found {len(contacts)} contacts with birthdays")
+        logger.info("Found %d contacts with birthdays", len(contacts))
         
-        # Create birthday events
-        created_count = 0
+        # Events recur yearly (RRULE:FREQ=YEARLY), so one pass over the
+        # current year covers future occurrences too; creating a second
+        # per-year copy would just duplicate the alerts
         current_year = datetime.now().year
-        
-        for contact in contacts:
-            logger.info(f"Processing birthday for: {contact['name']} ({contact['birthday']})")
-            if caldav_client.create_birthday_event(contact, current_year):
-                created_count += 1
-            
-            # Also create for next year
-            if caldav_client.create_birthday_event(contact, current_year + 1):
-                created_count += 1
-        
-        logger.info(f"Successfully created {created_count} birthday events")
+
+        # Prefetch existing events once so per-contact existence checks
+        # become in-memory lookups instead of one REPORT per contact
+        caldav_client.preload_existing_events(current_year)
+
+        created_count = caldav_client.create_birthday_events(contacts, current_year)
+
+        logger.info("Successfully created %d birthday events", created_count)
+        caldav_client.flush()
         return True
         
     except Exception as e:
@@ -192,6 +200,7 @@ def main():
         success = main_sync()
         sys.exit(0 if success else 1)
     elif run_mode == 'daemon':
+        from scheduler import SchedulerService
         scheduler = SchedulerService(main_sync, diagnose_cardav)
         try:
             scheduler.run_daemon()
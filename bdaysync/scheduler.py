@@ -2,15 +2,44 @@
 Scheduling service for periodic sync operations
 """
 
-import time
+import functools
+import heapq
+import os
+import select
 import signal
 import logging
-from datetime import datetime, timedelta
-from croniter import croniter
+import time
+from datetime import datetime
 from config import get_scheduler_config
 
 logger = logging.getLogger(__name__)
 
+_cached_croniter = None
+
+def _get_croniter():
+    """Import croniter and build the caching subclass on first use
+
+    croniter compiles a pile of regexes at import; deferring it keeps
+    `import scheduler` cheap for consumers that never construct the
+    daemon.
+    """
+    global _cached_croniter
+    if _cached_croniter is None:
+        from croniter import croniter
+
+        class _CachedCroniter(croniter):
+            """croniter with memoized field expansion
+
+            The daemon evaluates the same two schedule strings forever,
+            so the regex parse and field expansion are cached per
+            expression instead of being redone on every construction in
+            the scheduling loop.
+            """
+            expand = classmethod(functools.lru_cache(maxsize=32)(croniter.expand.__func__))
+
+        _cached_croniter = _CachedCroniter
+    return _cached_croniter
+
 class SchedulerService:
     """Service to handle scheduling sync operations"""
     
@@ -18,16 +47,63 @@ class SchedulerService:
         self.sync_func = sync_func
         self.diagnostic_func = diagnostic_func
         self.running = True
-        
+
+        # Self-pipe: the kernel writes the signal number here the
+        # moment a signal is delivered, so waits blocked in select wake
+        # instantly instead of at the next timeout check. The byte
+        # stays in the pipe until drained, so a signal arriving outside
+        # a wait is not lost either
+        self._wakeup_r, wakeup_w = os.pipe()
+        os.set_blocking(self._wakeup_r, False)
+        os.set_blocking(wakeup_w, False)
+        signal.set_wakeup_fd(wakeup_w)
+
         # Load scheduler configuration
         config = get_scheduler_config()
         self.sync_schedule = config['sync_schedule']
         self.diagnostic_schedule = config['diagnostic_schedule']
         self.sync_interval_hours = config['sync_interval_hours']
         self.startup_delay = config['startup_delay']
+        # Interval checks compare float timestamps, so precompute the
+        # interval in seconds
+        self._sync_interval_s = self.sync_interval_hours * 3600.0
         
         self.last_sync = None
-        
+        self._last_sync_ts = None
+
+        # Callable, log label, and whether success stamps last_sync,
+        # chosen here once so _perform_sync does no per-call selection
+        self._sync_op = (self.sync_func, 'Sync', True)
+        self._diag_op = (self.diagnostic_func, 'Diagnostic', False)
+
+        # The schedules never change after construction, so validate
+        # them here once; a bad expression falls back to hourly at
+        # startup instead of being rediscovered on every call
+        cron_cls = _get_croniter()
+        if not cron_cls.is_valid(self.sync_schedule):
+            logger.error(f"Invalid sync schedule '{self.sync_schedule}', falling back to hourly")
+            self.sync_schedule = '0 * * * *'
+        if not cron_cls.is_valid(self.diagnostic_schedule):
+            logger.error(f"Invalid diagnostic schedule '{self.diagnostic_schedule}', falling back to hourly")
+            self.diagnostic_schedule = '0 * * * *'
+
+        now = datetime.now()
+
+        # Persistent cursors; get_next advances their internal state
+        # without re-parsing the expression
+        self._sync_cron = cron_cls(self.sync_schedule, now)
+        self._diag_cron = cron_cls(self.diagnostic_schedule, now)
+
+        # Next-fire times are deterministic, so compute them once and
+        # advance after each firing; the loop then only compares
+        # datetimes instead of rebuilding croniter cursors every tick
+        self._next_sync_fire = self._sync_cron.get_next(datetime)
+        self._next_diag_fire = self._diag_cron.get_next(datetime)
+
+        # (fire_time, formatted) pairs so status logging only reruns
+        # strftime when a fire time actually advances
+        self._fire_strs = {}
+
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGTERM, self._signal_handler)
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -36,77 +112,78 @@ class SchedulerService:
         logger.info(f"Received signal {signum}, shutting down gracefully...")
         self.running = False
     
-    def _next_sync_time(self, schedule):
-        """Calculate next sync time based on cron schedule"""
-        try:
-            cron = croniter(schedule, datetime.now())
-            return cron.get_next(datetime)
-        except Exception as e:
-            logger.error(f"Invalid cron schedule '{schedule}': {e}")
-            # Fallback to hourly
-            return datetime.now() + timedelta(hours=1)
+    @staticmethod
+    def _advance_cron(cron, now):
+        """Advance a persistent cursor past now and return the fire time
+
+        get_next mutates the cursor in place, so catching up after a
+        long sleep costs one step per missed occurrence rather than a
+        re-parse and re-seek from the current time.
+        """
+        next_time = cron.get_next(datetime)
+        while next_time <= now:
+            next_time = cron.get_next(datetime)
+        return next_time
     
-    def _should_sync_interval(self):
-        """Check if we should sync based on interval"""
+    def _should_sync_interval(self, now_ts):
+        """Check if we should sync based on interval (float timestamps)"""
         if self.sync_interval_hours <= 0:
             return False
-        if self.last_sync is None:
+        if self._last_sync_ts is None:
             return True
-        return datetime.now() - self.last_sync >= timedelta(hours=self.sync_interval_hours)
-    
-    def _should_sync_cron(self, schedule):
-        """Check if we should sync based on cron schedule"""
-        try:
-            cron = croniter(schedule, datetime.now() - timedelta(minutes=1))
-            next_time = cron.get_next(datetime)
-            return next_time <= datetime.now()
-        except:
-            return False
+        return now_ts - self._last_sync_ts >= self._sync_interval_s
     
     def _perform_sync(self, diagnostic=False):
         """Perform the actual sync operation"""
+        return self._run_op(self._diag_op if diagnostic else self._sync_op)
+
+    def _run_op(self, op):
+        """Run one preselected (callable, label, stamps_last_sync) operation"""
+        func, label, stamps_last_sync = op
         try:
-            logger.info(f"Starting {'diagnostic' if diagnostic else 'sync'} operation...")
-            
-            if diagnostic:
-                # Run diagnostic
-                success = self.diagnostic_func()
-            else:
-                # Run main sync
-                success = self.sync_func()
-                if success:
-                    self.last_sync = datetime.now()
-            
+            logger.info("Starting %s operation...", label.lower())
+
+            success = func()
+            if success and stamps_last_sync:
+                self.last_sync = datetime.now()
+                self._last_sync_ts = time.time()
+
             if success:
-                logger.info(f"{'Diagnostic' if diagnostic else 'Sync'} operation completed successfully")
+                logger.info("%s operation completed successfully", label)
             else:
-                logger.warning(f"{'Diagnostic' if diagnostic else 'Sync'} operation completed with errors")
-                
+                logger.warning("%s operation completed with errors", label)
+
             return success
         except Exception as e:
-            logger.error(f"{'Diagnostic' if diagnostic else 'Sync'} operation failed: {e}")
+            logger.error("%s operation failed: %s", label, e)
             return False
     
     def _wait_with_interrupt_check(self, seconds):
-        """Wait for specified seconds while checking for interrupts"""
-        end_time = time.time() + seconds
-        while time.time() < end_time and self.running:
-            time.sleep(min(1, end_time - time.time()))
-    
-    def _get_next_schedule_info(self):
-        """Get information about the next scheduled events"""
+        """Wait for specified seconds, waking immediately on a signal"""
+        if not self.running:
+            return
+        # One blocking select on the wakeup pipe instead of a timed
+        # poll; signal delivery makes it readable at kernel level
         try:
-            sync_next = self._next_sync_time(self.sync_schedule)
-            diag_next = self._next_sync_time(self.diagnostic_schedule)
-            
-            return {
-                'sync_next': sync_next,
-                'diagnostic_next': diag_next,
-                'sync_schedule': self.sync_schedule,
-                'diagnostic_schedule': self.diagnostic_schedule
-            }
-        except:
-            return None
+            ready, _, _ = select.select([self._wakeup_r], [], [], seconds)
+        except InterruptedError:
+            return
+        if ready:
+            # Drain so later waits block again
+            try:
+                while os.read(self._wakeup_r, 64):
+                    pass
+            except BlockingIOError:
+                pass
+    
+    def _fire_str(self, key, fire_time):
+        """Format a fire time, cached until that fire time advances"""
+        cached = self._fire_strs.get(key)
+        if cached is not None and cached[0] == fire_time:
+            return cached[1]
+        formatted = fire_time.strftime('%Y-%m-%d %H:%M:%S')
+        self._fire_strs[key] = (fire_time, formatted)
+        return formatted
     
     def run_daemon(self):
         """Run as daemon with scheduled syncs"""
@@ -117,11 +194,11 @@ class SchedulerService:
         if self.sync_interval_hours > 0:
             logger.info(f"Sync interval: every {self.sync_interval_hours} hours")
         
-        # Show next scheduled times
-        schedule_info = self._get_next_schedule_info()
-        if schedule_info:
-            logger.info(f"Next sync: {schedule_info['sync_next'].strftime('%Y-%m-%d %H:%M:%S')}")
-            logger.info(f"Next diagnostic: {schedule_info['diagnostic_next'].strftime('%Y-%m-%d %H:%M:%S')}")
+        # Show next scheduled times; skip the formatting entirely when
+        # INFO records are suppressed
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Next sync: {self._fire_str('sync', self._next_sync_fire)}")
+            logger.info(f"Next diagnostic: {self._fire_str('diag', self._next_diag_fire)}")
         
         # Initial startup delay
         if self.startup_delay > 0:
@@ -136,38 +213,61 @@ class SchedulerService:
         logger.info("Running initial sync...")
         self._perform_sync()
         
-        # Main scheduling loop
-        loop_count = 0
+        # Main scheduling loop: a single heap of (fire_ts, kind)
+        # deadlines replaces the per-tick check of each schedule; each
+        # wake pops only what is due and pushes its next occurrence.
+        # Deadlines are float timestamps, so the per-wake work is float
+        # compares with no datetime allocation; datetimes only appear
+        # when a firing advances a cursor or a log line is formatted.
+        # The interval-mode sync is not cron-driven, so it stays
+        # outside the heap and folds into the wait deadline instead
+        heap = [(self._next_diag_fire.timestamp(), 'diag'),
+                (time.time() + 3600.0, 'status')]
+        if self.sync_interval_hours <= 0:
+            heap.append((self._next_sync_fire.timestamp(), 'sync'))
+        heapq.heapify(heap)
+
         while self.running:
             try:
-                loop_count += 1
-                
-                # Check if it's time for a sync
-                sync_needed = False
-                diagnostic_needed = False
-                
-                if self.sync_interval_hours > 0:
-                    sync_needed = self._should_sync_interval()
-                else:
-                    sync_needed = self._should_sync_cron(self.sync_schedule)
-                
-                diagnostic_needed = self._should_sync_cron(self.diagnostic_schedule)
-                
-                if diagnostic_needed:
-                    self._perform_sync(diagnostic=True)
-                elif sync_needed:
+                # One clock read per wake feeds every check below
+                now_ts = time.time()
+
+                if self._should_sync_interval(now_ts):
                     self._perform_sync()
-                
-                # Log status every 60 loops (60 minutes) to show we're alive
-                if loop_count % 60 == 0:
-                    logger.info("Scheduler daemon running - waiting for next scheduled operation")
-                    schedule_info = self._get_next_schedule_info()
-                    if schedule_info:
-                        logger.info(f"Next sync: {schedule_info['sync_next'].strftime('%Y-%m-%d %H:%M:%S')}")
-                
-                # Sleep for a minute before next check
-                self._wait_with_interrupt_check(60)
-                
+
+                while heap and heap[0][0] <= now_ts:
+                    _, kind = heapq.heappop(heap)
+                    if kind == 'sync':
+                        self._perform_sync()
+                        self._next_sync_fire = self._advance_cron(
+                            self._sync_cron, datetime.fromtimestamp(now_ts))
+                        heapq.heappush(heap, (self._next_sync_fire.timestamp(), 'sync'))
+                    elif kind == 'diag':
+                        self._perform_sync(diagnostic=True)
+                        self._next_diag_fire = self._advance_cron(
+                            self._diag_cron, datetime.fromtimestamp(now_ts))
+                        heapq.heappush(heap, (self._next_diag_fire.timestamp(), 'diag'))
+                    else:  # hourly "alive" status
+                        if logger.isEnabledFor(logging.INFO):
+                            logger.info("Scheduler daemon running - waiting for next scheduled operation")
+                            logger.info(f"Next sync: {self._fire_str('sync', self._next_sync_fire)}")
+                        heapq.heappush(heap, (now_ts + 3600.0, 'status'))
+
+                deadline = heap[0][0]
+                if self.sync_interval_hours > 0:
+                    base_ts = self._last_sync_ts if self._last_sync_ts is not None else now_ts
+                    interval_deadline = base_ts + self._sync_interval_s
+                    if interval_deadline <= now_ts:
+                        # The sync is overdue but the attempt above
+                        # failed (last_sync didn't advance); retry at
+                        # the old one-minute cadence instead of
+                        # spinning on the wait floor
+                        interval_deadline = now_ts + 60.0
+                    deadline = min(deadline, interval_deadline)
+
+                wait_s = deadline - time.time()
+                self._wait_with_interrupt_check(max(1.0, wait_s))
+
             except Exception as e:
                 logger.error(f"Error in scheduling loop: {e}")
                 self._wait_with_interrupt_check(60)